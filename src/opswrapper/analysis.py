@@ -231,26 +231,26 @@ class OpenSeesAnalysis:
         if opensees is None:
             raise RuntimeError(f"No executable found at {str(self.opensees_path)!r}")
 
-        LINE_BUFFERED = 1
         popen = partial(
             sub.Popen,
             [opensees, str(inputfile)],
-            bufsize=LINE_BUFFERED,
             stdout=sub.PIPE,
             stderr=sub.STDOUT,
             text=True,
         )
 
-        stdout = []
         if echo:
-            with popen() as p:
+            # Line buffered, so that output is echoed as soon as it's produced.
+            LINE_BUFFERED = 1
+            stdout = []
+            with popen(bufsize=LINE_BUFFERED) as p:
                 for line in p.stdout:
                     print(line, end="")
                     stdout.append(line)
+            stdout = "".join(stdout)
         else:
+            # Nothing to show along the way; read everything in large chunks.
             with popen() as p:
-                for line in p.stdout:
-                    stdout.append(line)
+                stdout, _ = p.communicate()
 
-        stdout = "".join(stdout)
         return AnalysisResults(p.returncode, stdout)
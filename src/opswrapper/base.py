@@ -1,8 +1,10 @@
 import abc
 import dataclasses
-from typing import TextIO, Union
+import functools
+import operator
+from typing import Callable, Optional, TextIO, Union
 
-from .formatting import MultiFormatSpec, SpecLike, _GLOBAL_FORMAT_SPEC
+from .formatting import MultiFormatSpec, SpecLike, _GLOBAL_FORMAT_SPEC, _printf_spec
 from .utils import coerce_numeric
 
 __all__ = [
@@ -47,22 +49,22 @@ class OpenSeesObject(abc.ABC):
     them later.
     """
 
+    # The last `str()` result; see `__str__`. Kept in a slot so that it doesn't
+    # show up in `vars()`, and left out of pickles and copies by `__getstate__`.
+    __slots__ = ("_str_cache",)
+
     _format_spec: MultiFormatSpec = _GLOBAL_FORMAT_SPEC
 
     def __post_init__(self):
         # Gently attempt to coerce numeric types. Not guarding against TypeError
         # from dataclasses.fields since __post_init__ only gets called on
         # dataclasses.
-        for field in dataclasses.fields(self):
-            value = getattr(self, field.name)
-            # A field's "type" isn't always strictly a type -- sometimes it's an
-            # annotation that doesn't resolve to a concrete type. For example,
-            # Union[str, int] causes coerce_numeric to panic when checking for
-            # numeric subclasses. I'm not sure if it makes more sense to check
-            # that here or inside coerce_numeric.
-            if isinstance(field.type, type):
-                value = coerce_numeric(value, field.type)
-            setattr(self, field.name, value)
+        for name, field_type in _typed_fields(type(self)):
+            value = getattr(self, name)
+            coerced = coerce_numeric(value, field_type)
+            # Most values already have the right type; skip reassigning those.
+            if coerced is not value:
+                setattr(self, name, coerced)
 
     def get_object_formats(self, objects: list, formats: SpecLike = None):
         """Get type-specific formatters for a list of objects, using this
@@ -80,8 +82,13 @@ class OpenSeesObject(abc.ABC):
         specs : list[str]
             List of specifiers, in the same order as `objects`.
         """
-        format_spec = self.get_format_spec(formats)
-        return [format_spec.get_format(obj) for obj in objects]
+        # Iterated more than once below, so it can't be a one-shot iterator.
+        objects = list(objects)
+        format_spec = self._resolve_format_spec(formats)
+        return [
+            format_spec.get_format(obj) if spec is None else spec
+            for obj, spec in zip(objects, _type_formats(objects, format_spec))
+        ]
 
     def format_objects(self, objects: list, formats: SpecLike = None) -> list[str]:
         """Format a list of objects according to their type.
@@ -93,16 +100,34 @@ class OpenSeesObject(abc.ABC):
         formats : SpecLike, optional
             Override format specifiers.
         """
-        format_spec = self.get_format_spec(formats)
-        formatted = []
-        for obj in objects:
-            if isinstance(obj, OpenSeesObject):
-                formatted.append(obj.tcl_code(formats))
-            else:
-                fmt = format_spec.get_format(obj)
-                formatted.append(format(obj, fmt))
+        objects = list(objects)
+        specs = _type_formats(objects, self._resolve_format_spec(formats))
+        return [
+            obj.tcl_code(formats) if spec is None else format(obj, spec)
+            for obj, spec in zip(objects, specs)
+        ]
+
+    def format_line(self, objects: list, formats: SpecLike = None) -> str:
+        """Format a list of objects according to their type and join them with
+        spaces.
+
+        Equivalent to ``' '.join(self.format_objects(objects, formats))``, but
+        if every object has a printf-style equivalent of its format specifier,
+        they are all formatted in a single ``%`` operation.
 
-        return formatted
+        Parameters
+        ----------
+        objects : list
+            The objects to format.
+        formats : SpecLike, optional
+            Override format specifiers.
+        """
+        objects = list(objects)
+        format_spec = self._resolve_format_spec(formats)
+        template = _printf_template(tuple(map(type, objects)), format_spec.key())
+        if template is None:
+            return " ".join(self.format_objects(objects, formats))
+        return template % tuple(objects)
 
     def get_format_spec(self, formats: SpecLike = None):
         """Return a copy of the format specifiers for this object.
@@ -123,6 +148,22 @@ class OpenSeesObject(abc.ABC):
             format_spec = self._format_spec.copy().update(formats)
         return format_spec
 
+    def _resolve_format_spec(self, formats: SpecLike = None) -> MultiFormatSpec:
+        """Like `get_format_spec`, but doesn't copy when `formats` is None.
+
+        The returned spec may be shared with this object (or its class, or the
+        global spec), so it must be treated as read-only.
+        """
+        if formats is None:
+            return self._format_spec
+        # The same few overrides are passed over and over, so reuse the merged
+        # spec instead of copying and updating the stored one on every call.
+        if isinstance(formats, MultiFormatSpec):
+            overrides = formats.key()
+        else:
+            overrides = tuple(formats.items())
+        return _merged_format_spec(self._format_spec.key(), overrides)
+
     def set_format_spec(self, formats: SpecLike):
         """Set the default format specifiers for this object.
 
@@ -189,10 +230,56 @@ class OpenSeesObject(abc.ABC):
         >>> ops.material.Elastic(1, 29000.0).tcl_args({float: 'e'})
         ['Elastic', '1' , '2.900000e+04']
         """
+        return self.format_objects(self._args(), formats)
+
+    def _args(self) -> list:
+        """Return the unformatted arguments to the Tcl command.
+
+        Used by `tcl_args` and `_tcl_line`; commands whose code is a single line
+        can override this instead of `tcl_code` and `tcl_args`.
+        """
         raise NotImplementedError()
 
+    def _tcl_line(self, formats: SpecLike = None) -> str:
+        """Format the arguments from `_args` and join them with spaces.
+
+        Subclasses anywhere in the hierarchy that override `tcl_args` (the
+        extension point before `_args` existed) get their `tcl_args` joined
+        instead, so that the override is honored.
+        """
+        if type(self).tcl_args is not OpenSeesObject.tcl_args:
+            return " ".join(self.tcl_args(formats))
+        return self.format_line(self._args(), formats)
+
     def __str__(self):
-        return self.tcl_code()
+        # Scripts are assembled by converting objects to str, often repeatedly
+        # for the same object. When every field holds an immutable scalar,
+        # remember the last result along with the field values and format spec
+        # it came from. The values are compared by identity rather than
+        # equality, since equal values can still format differently (0.0 and
+        # -0.0, for example).
+        get_values = _field_getter(type(self))
+        if get_values is None:
+            return self.tcl_code()
+
+        values = get_values(self)
+        spec_key = self._format_spec.key()
+        cached = getattr(self, "_str_cache", None)
+        if (
+            cached is not None
+            and cached[1] == spec_key
+            and all(map(operator.is_, cached[0], values))
+        ):
+            return cached[2]
+
+        code = self.tcl_code()
+        if _all_immutable(tuple(map(type, values))):
+            # Set directly to bypass any __setattr__ hooks in subclasses.
+            object.__setattr__(self, "_str_cache", (values, spec_key, code))
+        return code
+
+    def __getstate__(self):
+        return self.__dict__
 
     def __format__(self, float_spec=None):
         return self.tcl_code({float: float_spec})
@@ -210,7 +297,134 @@ class OpenSeesObject(abc.ABC):
         formats : SpecLike
             Format specifiers to use instead of the defaults.
         """
-        print(self.tcl_code(formats), file=fid)
+        fid.write(self.tcl_code(formats))
+        fid.write("\n")
+
+
+class _CachedTclCode(OpenSeesObject):
+    """Base for objects that cache their rendered Tcl code.
+
+    The cache is a dict created on first use by `_tcl_code_cache`, and cleared
+    whenever an attribute is assigned. It is not part of the object's state:
+    copies and unpickled objects start out with an empty cache of their own.
+    """
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        cache = self.__dict__.get("_tcl_cache")
+        if cache:
+            cache.clear()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_tcl_cache", None)
+        return state
+
+    def _tcl_code_cache(self) -> dict:
+        """Return the cache of rendered Tcl code, creating it if necessary."""
+        try:
+            return self.__dict__["_tcl_cache"]
+        except KeyError:
+            # Stored directly to bypass the cache-clearing __setattr__.
+            cache = self.__dict__["_tcl_cache"] = {}
+            return cache
+
+
+@functools.lru_cache(maxsize=None)
+def _typed_fields(cls: type) -> tuple[tuple[str, type], ...]:
+    """Names and types of the fields of dataclass `cls` that are actual types.
+
+    Computed once per class, rather than walking `dataclasses.fields` every time
+    an object is created.
+    """
+    # A field's "type" isn't always strictly a type -- sometimes it's an
+    # annotation that doesn't resolve to a concrete type. For example,
+    # Union[str, int] causes coerce_numeric to panic when checking for
+    # numeric subclasses. I'm not sure if it makes more sense to check
+    # that here or inside coerce_numeric.
+    return tuple(
+        (field.name, field.type)
+        for field in dataclasses.fields(cls)
+        if isinstance(field.type, type)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _field_getter(cls: type) -> Optional[Callable[[object], tuple]]:
+    """Return a function that fetches the values of all fields of dataclass
+    `cls` as a tuple, or None if `cls` is not a dataclass."""
+    try:
+        names = tuple(field.name for field in dataclasses.fields(cls))
+    except TypeError:
+        return None
+
+    if len(names) > 1:
+        return operator.attrgetter(*names)
+
+    # attrgetter only returns a tuple when given more than one name.
+    def get_values(obj):
+        return tuple(getattr(obj, name) for name in names)
+
+    return get_values
+
+
+_IMMUTABLE_TYPES = (bool, int, float, str, type(None))
+
+
+@functools.lru_cache(maxsize=1024)
+def _all_immutable(types: tuple[type, ...]) -> bool:
+    """Return True if values of all of `types` are immutable scalars."""
+    return all(issubclass(t, _IMMUTABLE_TYPES) for t in types)
+
+
+def _type_formats(
+    objects: list, format_spec: MultiFormatSpec
+) -> tuple[Optional[str], ...]:
+    """Format specifiers for `objects`, or None for any `OpenSeesObject`s.
+
+    The specifiers only depend on the types of the objects, and the same few
+    argument signatures are formatted over and over, so the lookups are cached
+    per signature and format spec.
+    """
+    return _type_formats_cached(tuple(map(type, objects)), format_spec.key())
+
+
+@functools.lru_cache(maxsize=1024)
+def _type_formats_cached(
+    types: tuple[type, ...], spec_items: tuple[tuple[type, str], ...]
+) -> tuple[Optional[str], ...]:
+    format_spec = MultiFormatSpec(dict(spec_items))
+    return tuple(
+        None if issubclass(t, OpenSeesObject) else format_spec.get_type_format(t)
+        for t in types
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _merged_format_spec(
+    spec_items: tuple[tuple[type, str], ...],
+    override_items: tuple[tuple[type, str], ...],
+) -> MultiFormatSpec:
+    """Format spec with `override_items` applied on top of `spec_items`.
+
+    The result is shared between callers, so it must not be modified.
+    """
+    return MultiFormatSpec(dict(spec_items)).update(dict(override_items))
+
+
+@functools.lru_cache(maxsize=1024)
+def _printf_template(
+    types: tuple[type, ...], spec_items: tuple[tuple[type, str], ...]
+) -> Optional[str]:
+    """Printf-style template that formats values of `types` in one go, or None if
+    any of them lacks an equivalent directive."""
+    directives = []
+    for t, spec in zip(types, _type_formats_cached(types, spec_items)):
+        directive = None if spec is None else _printf_spec(spec, t)
+        if directive is None:
+            return None
+        directives.append(directive)
+    return " ".join(directives)
 
 
 OpenSeesDef = Union[str, OpenSeesObject]
@@ -117,6 +117,23 @@ class PathOf(MutableMapping[str, Path]):
     def __delitem__(self, key: str):
         del self._config[key]
 
+    # The MutableMapping mixins implement these on top of __getitem__ and
+    # __iter__; delegate straight to the underlying dict instead.
+    def __contains__(self, key: object) -> bool:
+        return key in self._config
+
+    def get(self, key: str, default=None):
+        return self._config.get(key, default)
+
+    def keys(self):
+        return self._config.keys()
+
+    def items(self):
+        return self._config.items()
+
+    def values(self):
+        return self._config.values()
+
     def __dir__(self):
         return super().__dir__() + [
             key
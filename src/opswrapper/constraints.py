@@ -5,7 +5,7 @@ from .base import OpenSeesObject
 
 class Constraints(OpenSeesObject):
     def tcl_code(self, formats=None) -> str:
-        return " ".join(["constraints", *self.tcl_args(formats=formats)])
+        return "constraints " + self._tcl_line(formats)
 
 
 @dataclasses.dataclass
@@ -15,6 +15,10 @@ class Plain(Constraints):
     Only supports constraints applied using the 'fix' and 'equalDOF' commands.
     """
 
+    # No arguments to format, so skip the formatting machinery entirely.
+    def tcl_code(self, formats=None) -> str:
+        return "constraints Plain"
+
     def tcl_args(self, formats=None) -> list[str]:
         return ["Plain"]
 
@@ -39,6 +43,10 @@ class Transformation(Constraints):
        not constrained in any other constraint.
     """
 
+    # No arguments to format, so skip the formatting machinery entirely.
+    def tcl_code(self, formats=None) -> str:
+        return "constraints Transformation"
+
     def tcl_args(self, formats=None) -> list[str]:
         return ["Transformation"]
 
@@ -65,9 +73,9 @@ class Lagrange(Constraints):
     alpha_s: float
     alpha_m: float
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         args = ["Lagrange", self.alpha_s, self.alpha_m]
-        return self.format_objects(args, formats)
+        return args
 
 
 @dataclasses.dataclass
@@ -92,6 +100,6 @@ class Penalty(Constraints):
     alpha_s: float
     alpha_m: float
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         args = ["Penalty", self.alpha_s, self.alpha_m]
-        return self.format_objects(args, formats)
+        return args
@@ -12,7 +12,7 @@ class Element(base.OpenSeesObject):
     jnode: int
 
     def tcl_code(self, formats=None) -> str:
-        return "element " + " ".join(self.tcl_args(formats))
+        return "element " + self._tcl_line(formats)
 
 
 @dataclasses.dataclass
@@ -51,7 +51,7 @@ class ElasticBeamColumn2D(Element):
     mass: float = None
     cmass: bool = False
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         args = [
             "elasticBeamColumn",
             self.tag,
@@ -66,7 +66,7 @@ class ElasticBeamColumn2D(Element):
             args.extend(["-mass", self.mass])
         if self.cmass:
             args.append("-cMass")
-        return self.format_objects(args, formats)
+        return args
 
 
 @dataclasses.dataclass
@@ -81,7 +81,7 @@ class ElasticBeamColumn3D(Element):
     mass: float = None
     cmass: bool = False
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         args = [
             "elasticBeamColumn",
             self.tag,
@@ -99,7 +99,7 @@ class ElasticBeamColumn3D(Element):
             args.extend(["-mass", self.mass])
         if self.cmass:
             args.append("-cMass")
-        return self.format_objects(args, formats)
+        return args
 
 
 @dataclasses.dataclass
@@ -135,7 +135,7 @@ class ForceBeamColumn(Element):
     maxiters: int = 10
     itertol: float = 1e-12
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         args = [
             "forceBeamColumn",
             self.tag,
@@ -148,7 +148,7 @@ class ForceBeamColumn(Element):
             args.extend(["-mass", self.mass])
         if self.iterative:
             args.extend(["-iter", self.maxiters, self.itertol])
-        return self.format_objects(args, formats)
+        return args
 
 
 @dataclasses.dataclass
@@ -186,7 +186,7 @@ class DispBeamColumn(Element):
     cmass: bool = False
     integration: str = "Legendre"
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         try:
             nsections = len(self.section)
             if nsections not in (self.npoints, 1):
@@ -213,7 +213,7 @@ class DispBeamColumn(Element):
         if self.integration != "Legendre":
             args.extend("-integration", self.integration)
 
-        return self.format_objects(args, formats)
+        return args
 
 
 @dataclasses.dataclass
@@ -249,7 +249,7 @@ class Truss(Element):
     do_rayleigh: bool = False
     corot: bool = False
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         element = "corotTruss" if self.corot else "truss"
         args = [element, self.tag, self.inode, self.jnode, self.A, self.mat]
         if self.rho is not None:
@@ -258,7 +258,7 @@ class Truss(Element):
             args.extend(["-cMass", self.cmass])
         if self.do_rayleigh:
             args.extend(["-doRayleigh", self.do_rayleigh])
-        return self.format_objects(args, formats)
+        return args
 
 
 @dataclasses.dataclass
@@ -291,7 +291,7 @@ class TrussSection(Element):
     do_rayleigh: bool = False
     corot: bool = False
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         element = "corotTrussSection" if self.corot else "trussSection"
         args = [element, self.tag, self.inode, self.jnode, self.section]
         if self.rho is not None:
@@ -300,4 +300,4 @@ class TrussSection(Element):
             args.extend(["-cMass", self.cmass])
         if self.do_rayleigh:
             args.extend(["-doRayleigh", self.do_rayleigh])
-        return self.format_objects(args, formats)
+        return args
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import dataclasses
-from typing import Union
+import re
+from typing import Optional, Union
 
 __all__ = [
     "MultiFormatSpec",
@@ -14,6 +15,10 @@ class MultiFormatSpec:
     """Specifiers for formatting of different types."""
 
     _spec: SpecDict = dataclasses.field(default_factory=dict)
+    # Snapshot of `_spec` returned by `key()`; reset whenever `_spec` changes.
+    _key: Optional[tuple] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     # Properties for temporary backwards compatibility
     @property
@@ -55,8 +60,19 @@ class MultiFormatSpec:
             self._spec.update(other._spec)
         else:
             self._spec.update(other)
+        self._key = None
         return self
 
+    def key(self) -> tuple:
+        """Return a hashable snapshot of the specifiers.
+
+        Two specs with the same key format everything identically, so this is
+        suitable for keying caches of formatted output.
+        """
+        if self._key is None:
+            self._key = tuple(self._spec.items())
+        return self._key
+
     def get_format(self, obj: object):
         """Find a format specifier for the given object.
 
@@ -76,11 +92,28 @@ class MultiFormatSpec:
         fmt : str
             The format string to use for `obj`.
         """
+        return self.get_type_format(obj.__class__)
+
+    def get_type_format(self, cls: type):
+        """Find a format specifier for objects of the given type.
+
+        Follows the same rules as `get_format`.
+
+        Parameters
+        ----------
+        cls : type
+            The type to get a format for.
+
+        Returns
+        -------
+        fmt : str
+            The format string to use for objects of type `cls`.
+        """
         try:
-            fmt = self._spec[obj.__class__]
+            fmt = self._spec[cls]
         except KeyError:
             for type, fmt in self._spec.items():  # noqa: B007
-                if isinstance(obj, type):
+                if issubclass(cls, type):
                     break
             else:
                 fmt = ""
@@ -100,6 +133,7 @@ class MultiFormatSpec:
             raise TypeError(f"cls must be a type, not a {cls.__class__!r}")
 
         self._spec[cls] = fmt
+        self._key = None
 
 
 SpecDict = dict[type, str]
@@ -148,3 +182,37 @@ def get_global_format_spec():
 def get_format(o):
     """Get the globally-set format specifier for an object."""
     return _GLOBAL_FORMAT_SPEC.get_format(o)
+
+
+# Format specs that produce identical output under `format()` and printf-style
+# `%` formatting. Fill/alignment, grouping, and the '%' and 'n' types are
+# deliberately excluded.
+_PRINTF_COMPATIBLE = {
+    float: re.compile(r"[+ ]?#?0?\d*(\.\d+)?[eEfFgG]"),
+    int: re.compile(r"[+ ]?0?\d*d"),
+}
+
+
+def _printf_spec(spec: str, cls: type) -> Optional[str]:
+    """Translate a format spec into the equivalent printf-style directive.
+
+    Parameters
+    ----------
+    spec : str
+        Format spec, as used by `format()`.
+    cls : type
+        Type of the value being formatted. Only `int`, `float`, and `str` (with
+        no spec) are supported.
+
+    Returns
+    -------
+    directive : str or None
+        The printf-style directive (e.g., '%.12g'), or None if there isn't one
+        that is guaranteed to produce the same output.
+    """
+    if cls is str:
+        return "%s" if spec in ("", "s") else None
+    pattern = _PRINTF_COMPATIBLE.get(cls)
+    if pattern is None or pattern.fullmatch(spec) is None:
+        return None
+    return "%" + spec
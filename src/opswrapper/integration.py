@@ -10,7 +10,7 @@ from .utils import coerce_numeric
 @dataclasses.dataclass
 class Integration(base.OpenSeesObject):
     def tcl_code(self, formats=None) -> str:
-        return '"' + " ".join(self.tcl_args(formats)) + '"'
+        return '"' + self._tcl_line(formats) + '"'
 
 
 # ======================================================================================
@@ -35,9 +35,9 @@ class Lobatto(Integration):
     section: int
     npoints: int
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         args = ["Lobatto", self.section, self.npoints]
-        return self.format_objects(args, formats)
+        return args
 
 
 @dataclasses.dataclass
@@ -59,9 +59,9 @@ class Legendre(Integration):
     section: int
     npoints: int
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         args = ["Legendre", self.section, self.npoints]
-        return self.format_objects(args, formats)
+        return args
 
 
 @dataclasses.dataclass
@@ -84,9 +84,9 @@ class Radau(Integration):
     section: int
     npoints: int
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         args = ["Radau", self.section, self.npoints]
-        return self.format_objects(args, formats)
+        return args
 
 
 @dataclasses.dataclass
@@ -107,9 +107,9 @@ class NewtonCotes(Integration):
     section: int
     npoints: int
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         args = ["NewtonCotes", self.section, self.npoints]
-        return self.format_objects(args, formats)
+        return args
 
 
 @dataclasses.dataclass()
@@ -131,11 +131,11 @@ class FixedLocation(Integration):
         if len(self.sections) != len(self.locations):
             raise ValueError("FixedLocation: len(sections) must equal len(locations)")
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         args = ["FixedLocation", len(self.sections)]
         args.extend([coerce_numeric(tag, int) for tag in self.sections])
         args.extend([coerce_numeric(loc, float) for loc in self.locations])
-        return self.format_objects(args, formats)
+        return args
 
 
 # ======================================================================================
@@ -149,11 +149,9 @@ class PlasticHinge(Integration):
     lp_j: float
     sec_e: int
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         typ = type(self).__name__
-        return self.format_objects(
-            [typ, self.sec_i, self.lp_i, self.sec_j, self.lp_j, self.sec_e], formats
-        )
+        return [typ, self.sec_i, self.lp_i, self.sec_j, self.lp_j, self.sec_e]
 
 
 @dataclasses.dataclass
@@ -18,7 +18,7 @@ __all__ = [
 
 class Integrator(OpenSeesObject):
     def tcl_code(self, formats=None) -> str:
-        return " ".join(["integrator", *self.tcl_args(formats)])
+        return "integrator " + self._tcl_line(formats)
 
 
 # ======================================================================================
@@ -60,11 +60,11 @@ class LoadControl(StaticIntegrator):
     min_incr: float = None
     max_incr: float = None
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         min_incr = self.incr if self.min_incr is None else self.min_incr
         max_incr = self.incr if self.max_incr is None else self.max_incr
         args = ["LoadControl", self.incr, self.num_iters, min_incr, max_incr]
-        return self.format_objects(args, formats)
+        return args
 
 
 @dataclasses.dataclass
@@ -95,7 +95,7 @@ class DisplacementControl(StaticIntegrator):
     min_incr: float = None
     max_incr: float = None
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         min_incr = self.incr if self.min_incr is None else self.min_incr
         max_incr = self.incr if self.max_incr is None else self.max_incr
         args = [
@@ -107,7 +107,7 @@ class DisplacementControl(StaticIntegrator):
             min_incr,
             max_incr,
         ]
-        return self.format_objects(args, formats)
+        return args
 
 
 @dataclasses.dataclass
@@ -138,11 +138,11 @@ class MinUnbalDispNorm(StaticIntegrator):
     min_incr: float = None
     max_incr: float = None
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         min_incr = self.incr if self.min_incr is None else self.min_incr
         max_incr = self.incr if self.max_incr is None else self.max_incr
         args = ["MinUnbalDispNorm", self.incr, self.Jd, min_incr, max_incr]
-        return self.format_objects(args, formats)
+        return args
 
 
 @dataclasses.dataclass
@@ -167,8 +167,8 @@ class ArcLength(StaticIntegrator):
     s: float
     alpha: float
 
-    def tcl_args(self, formats=None) -> list[str]:
-        return self.format_objects(["ArcLength", self.s, self.alpha], formats)
+    def _args(self) -> list:
+        return ["ArcLength", self.s, self.alpha]
 
 
 # ======================================================================================
@@ -191,7 +191,11 @@ class CentralDifference(TransientIntegrator):
     3. For stability, Δt/Tn < 1/π.
     """
 
-    def tcl_args(self, formats) -> list[str]:
+    # No arguments to format, so skip the formatting machinery entirely.
+    def tcl_code(self, formats=None) -> str:
+        return "integrator CentralDifference"
+
+    def tcl_args(self, formats=None) -> list[str]:
         return ["CentralDifference"]
 
 
@@ -223,8 +227,8 @@ class Newmark(TransientIntegrator):
     gamma: float
     beta: float
 
-    def tcl_args(self, formats=None) -> list[str]:
-        return self.format_objects(["Newmark", self.gamma, self.beta], formats)
+    def _args(self) -> list:
+        return ["Newmark", self.gamma, self.beta]
 
 
 @dataclasses.dataclass
@@ -267,11 +271,11 @@ class HHT(TransientIntegrator):
     def default_beta(self):
         return 1.5 - self.alpha
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         args = ["HHT", self.alpha]
         if self.gamma is not None or self.beta is not None:
             # OpenSees wants gamma and beta both specified if either is not default
             args.append(self.gamma if self.gamma is not None else self.default_gamma)
             args.append(self.beta if self.beta is not None else self.default_beta)
 
-        return self.format_objects(args, formats)
+        return args
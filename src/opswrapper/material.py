@@ -10,7 +10,7 @@ class UniaxialMaterial(base.OpenSeesObject):
     tag: int
 
     def tcl_code(self, formats=None) -> str:
-        return "uniaxialMaterial " + " ".join(self.tcl_args(formats))
+        return "uniaxialMaterial " + self._tcl_line(formats)
 
 
 # ======================================================================================
@@ -40,7 +40,7 @@ class Elastic(UniaxialMaterial):
     eta: float = 0.0
     Eneg: float = None
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         args = ["Elastic", self.tag, self.E]
         if self.Eneg is not None:
             args.append(self.eta)
@@ -48,7 +48,7 @@ class Elastic(UniaxialMaterial):
         elif self.eta != 0.0:
             args.append(self.eta)
 
-        return self.format_objects(args, formats)
+        return args
 
 
 @dataclasses.dataclass
@@ -79,7 +79,7 @@ class ElasticPP(UniaxialMaterial):
     eps_yN: float = None
     eps0: float = 0.0
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         args = ["ElasticPP", self.tag, self.E, self.eps_y]
         eps_yN = self.eps_yN if self.eps_yN is not None else self.eps_y
         if self.eps0 != 0.0:
@@ -88,7 +88,7 @@ class ElasticPP(UniaxialMaterial):
         elif self.eps_yN is not None:
             args.append(eps_yN)
 
-        return self.format_objects(args, formats)
+        return args
 
 
 @dataclasses.dataclass
@@ -121,7 +121,7 @@ class Hardening(UniaxialMaterial):
     h_kin: float
     eta: float = 0.0
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         args = [
             "Hardening",
             self.tag,
@@ -133,7 +133,7 @@ class Hardening(UniaxialMaterial):
         if self.eta != 0.0:
             args.append(self.eta)
 
-        return self.format_objects(args, formats)
+        return args
 
 
 # ======================================================================================
@@ -189,12 +189,12 @@ class Steel01(UniaxialMaterial):
                 f"(expected 4 params, got {nparams})"
             )
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         args = ["Steel01", self.tag, self.Fy, self.E, self.b]
         if self._num_iso_params_defined() == 4:
             args.extend([self.a1, self.a2, self.a3, self.a4])
 
-        return self.format_objects(args, formats)
+        return args
 
 
 @dataclasses.dataclass
@@ -256,7 +256,7 @@ class Steel02(UniaxialMaterial):
     def _num_iso_params_defined(self):
         return sum([a is not None for a in (self.a1, self.a2, self.a3, self.a4)])
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         args = [
             "Steel02",
             self.tag,
@@ -277,7 +277,7 @@ class Steel02(UniaxialMaterial):
         elif n_iso_params == 4:
             args.extend([self.a1, self.a2, self.a3, self.a4])
 
-        return self.format_objects(args, formats)
+        return args
 
 
 # ======================================================================================
@@ -376,7 +376,7 @@ class Bilin(UniaxialMaterial):
     D_neg: float = 1.0
     nfactor: float = None
 
-    def tcl_args(self, formats=None) -> list[str]:
+    def _args(self) -> list:
         args = ["Bilin"]
         args += [
             getattr(self, field.name)
@@ -386,4 +386,4 @@ class Bilin(UniaxialMaterial):
         if self.nfactor is not None:
             args.append(self.nfactor)
 
-        return self.format_objects(args, formats)
+        return args
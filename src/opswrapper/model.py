@@ -31,7 +31,7 @@ class Model(base.OpenSeesObject):
 
     def tcl_code(self, formats=None) -> str:
         args = ["model", "basic", "-ndm", self.ndm, "-ndf", self.ndf]
-        return " ".join(self.format_objects(args, formats))
+        return self.format_line(args, formats)
 
 
 @dataclasses.dataclass(init=False)
@@ -71,4 +71,4 @@ class Node(base.OpenSeesObject):
         if self.mass is not None:
             args.append("-mass")
             args.extend([coerce_numeric(m, float) for m in self.mass])
-        return " ".join(self.format_objects(args, formats))
+        return self.format_line(args, formats)
@@ -65,13 +65,11 @@ class ElementRecorder(base.OpenSeesObject):
         file_arg, tcl_list_expansion = _format_file_arg(self.file)
         args.append(file_arg)
 
-        if str(self.elements) == "all":
+        if _is_all(self.elements):
             args.append(f"-ele {tcl_list_expansion}[getEleTags]")
         elif self.elements is not None:
             args.append("-ele")
-            args.extend(
-                utils.coerce_numeric(tag, int) for tag in np.asarray(self.elements).flat
-            )
+            args.extend(_int_args(self.elements))
 
         if self.region is not None:
             args.append("-region")
@@ -83,12 +81,10 @@ class ElementRecorder(base.OpenSeesObject):
 
         if self.dofs is not None:
             args.append("-dof")
-            args.extend(
-                utils.coerce_numeric(dof, int) for dof in np.asarray(self.dofs).flat
-            )
+            args.extend(_int_args(self.dofs))
 
         args.append(self.response)
-        return " ".join(self.format_objects(args, formats))
+        return self.format_line(args, formats)
 
 
 @dataclasses.dataclass
@@ -183,13 +179,11 @@ class NodeRecorder(base.OpenSeesObject):
         if self.time:
             args.append("-time")
 
-        if str(self.nodes) == "all":
+        if _is_all(self.nodes):
             args.append(f"-node {tcl_list_expansion}[getNodeTags]")
         elif self.nodes is not None:
             args.append("-node")
-            args.extend(
-                utils.coerce_numeric(tag, int) for tag in np.asarray(self.nodes).flat
-            )
+            args.extend(_int_args(self.nodes))
 
         if self.node_range is not None:
             args.append("-nodeRange")
@@ -201,12 +195,10 @@ class NodeRecorder(base.OpenSeesObject):
 
         if self.dofs is not None:
             args.append("-dof")
-            args.extend(
-                utils.coerce_numeric(dof, int) for dof in np.asarray(self.dofs).flat
-            )
+            args.extend(_int_args(self.dofs))
 
         args.append(self.response)
-        return " ".join(self.format_objects(args, formats))
+        return self.format_line(args, formats)
 
 
 def _format_file_arg(file: Union[str, Path, None] = None) -> tuple[str, str]:
@@ -221,3 +213,40 @@ def _format_file_arg(file: Union[str, Path, None] = None) -> tuple[str, str]:
         file_arg = utils.tclescape(utils.path_for_tcl(file))
         tcl_list_expansion = "{*}"
     return file_arg, tcl_list_expansion
+
+
+def _is_all(tags) -> bool:
+    """Return True if `tags` is the string 'all' (possibly as a 0-d array)."""
+    # Checked without str() on arbitrary arrays, which renders every element.
+    return (
+        isinstance(tags, (str, np.ndarray))
+        and np.ndim(tags) == 0
+        and str(tags) == "all"
+    )
+
+
+def _int_args(values) -> list:
+    """Flatten `values` into a list, coercing numbers to int where possible."""
+    array = np.asarray(values)
+    # Numeric arrays whose values all fit in an int64 can be converted at once;
+    # anything else (e.g. Tcl variables mixed in with tags, or huge values that
+    # would wrap around) is coerced one value at a time.
+    if _fits_int64(array):
+        return array.astype(np.int64).ravel().tolist()
+    return [utils.coerce_numeric(value, int) for value in array.flat]
+
+
+def _fits_int64(array: np.ndarray) -> bool:
+    """Return True if `array` is numeric and every value converts to int64
+    without overflow."""
+    kind = array.dtype.kind
+    if array.size == 0:
+        return kind in "iuf"
+    if kind == "i":
+        return True
+    if kind == "u":
+        return array.dtype.itemsize < 8 or array.max() < 2**63
+    if kind == "f":
+        # NaN fails the comparison, as it should; inf is too large anyway.
+        return bool(np.abs(array).max() < 2.0**63)
+    return False
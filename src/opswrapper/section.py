@@ -1,6 +1,16 @@
 import dataclasses
+import itertools
+from collections.abc import Iterable
+from typing import ClassVar, Optional, TextIO
+
+import numpy as np
 
 from . import base
+from .formatting import MultiFormatSpec, SpecLike, _printf_spec
+
+# Constant prefixes shared by the section commands.
+_SECTION_ELASTIC = "section Elastic"
+_SECTION_FIBER = "section Fiber "
 
 
 @dataclasses.dataclass
@@ -42,12 +52,18 @@ class Elastic2D(Section):
     alphaY: float = None
 
     def tcl_code(self, formats=None) -> str:
-        fmt = self.get_format_spec(formats)
+        fmt = self._resolve_format_spec(formats)
         i, f = fmt.int, fmt.float
-        code = f"section Elastic {self.tag:{i}} {self.E:{f}} {self.A:{f}} {self.Iz:{f}}"
+        args = [
+            _SECTION_ELASTIC,
+            format(self.tag, i),
+            format(self.E, f),
+            format(self.A, f),
+            format(self.Iz, f),
+        ]
         if self.G is not None and self.alphaY is not None:
-            code += f" {self.G:{f}} {self.alphaY:{f}}"
-        return code
+            args.extend((format(self.G, f), format(self.alphaY, f)))
+        return " ".join(args)
 
 
 @dataclasses.dataclass
@@ -90,23 +106,104 @@ class Elastic3D(Section):
     alphaZ: float = None
 
     def tcl_code(self, formats=None) -> str:
-        fmt = self.get_format_spec(formats)
+        fmt = self._resolve_format_spec(formats)
         i, f = fmt.int, fmt.float
-        code = (
-            f"section Elastic {self.tag:{i}} {self.E:{f}} {self.A:{f}}"
-            f" {self.Iz:{f}} {self.Iy:{f}} {self.G:{f}} {self.J:{f}}"
-        )
+        args = [
+            _SECTION_ELASTIC,
+            format(self.tag, i),
+            format(self.E, f),
+            format(self.A, f),
+            format(self.Iz, f),
+            format(self.Iy, f),
+            format(self.G, f),
+            format(self.J, f),
+        ]
         if self.alphaY is not None and self.alphaZ is not None:
-            code += f" {self.alphaY:{f}} {self.alphaZ:{f}}"
-        return code
+            args.extend((format(self.alphaY, f), format(self.alphaZ, f)))
+        return " ".join(args)
 
 
 # ======================================================================================
 # Fiber section
 # ======================================================================================
+# Blocks with more fibers than this are formatted with a single printf-style
+# operation instead of line-by-line.
+_FIBER_BLOCK_VECTORIZE_THRESHOLD = 256
+
+# Source of the versions stamped on fiber section commands when they change.
+_command_versions = itertools.count()
+
+
 class FiberSectionCommand(base.OpenSeesObject):
+    # Name of the Tcl command, including any subcommand (e.g., 'patch quad').
+    _command: ClassVar[str]
+    # Memoized `str.format` templates, keyed by the format specs of the values.
+    _templates: ClassVar[dict[tuple[str, ...], Optional[str]]]
+    # Whether every change to the command goes through attribute assignment,
+    # so that `Fiber` can cache code that contains it.
+    _cacheable: ClassVar[bool] = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._templates = {}
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Stamp a new version on every change; `Fiber` compares versions to
+        # tell whether its cached code is still current.
+        self.__dict__["_version"] = next(_command_versions)
+
+    def _values(self) -> tuple:
+        """Return the arguments to the Tcl command, in order."""
+        raise NotImplementedError()
+
+    @classmethod
+    def _template(cls, specs: tuple[str, ...]) -> Optional[str]:
+        """Return the `str.format` template for the given value specs.
+
+        Returns None if a spec can't be embedded in a template (i.e., it
+        contains braces).
+        """
+        try:
+            return cls._templates[specs]
+        except KeyError:
+            pass
+
+        if any("{" in spec or "}" in spec for spec in specs):
+            template = None
+        else:
+            template = " ".join([cls._command, *[f"{{:{spec}}}" for spec in specs]])
+        cls._templates[specs] = template
+        return template
+
+    @classmethod
+    def _format_line(cls, values: tuple, specs: tuple[str, ...]) -> str:
+        """Format a single command line from its values and their specs."""
+        template = cls._template(specs)
+        if template is not None:
+            return template.format(*values)
+        return " ".join(
+            [cls._command, *[format(v, spec) for v, spec in zip(values, specs)]]
+        )
+
+    def _emit(self, out: list[str], format_spec: MultiFormatSpec, indent: str = ""):
+        """Append the formatted command to `out`.
+
+        Each line of the command is prefixed by `indent` and terminated by a
+        newline. `format_spec` must already be resolved; it is used as-is.
+        """
+        get_format = format_spec.get_format
+        values = self._values()
+        specs = tuple([get_format(value) for value in values])
+        out.extend((indent, self._format_line(values, specs), "\n"))
+
+    def tcl_args(self, formats=None) -> list[str]:
+        return self.format_objects([*self._command.split(), *self._values()], formats)
+
     def tcl_code(self, formats=None) -> str:
-        return " ".join(self.tcl_args(formats))
+        out = []
+        self._emit(out, self._resolve_format_spec(formats))
+        return "".join(out).removesuffix("\n")
 
 
 @dataclasses.dataclass
@@ -116,10 +213,10 @@ class fiber(FiberSectionCommand):
     A: float
     mat: int
 
-    def tcl_args(self, formats=None) -> list[str]:
-        return self.format_objects(
-            ["    fiber", self.y, self.z, self.A, self.mat], formats
-        )
+    _command = "fiber"
+
+    def _values(self) -> tuple:
+        return (self.y, self.z, self.A, self.mat)
 
 
 @dataclasses.dataclass
@@ -136,24 +233,21 @@ class patch_quad(FiberSectionCommand):
     yL: float
     zL: float
 
-    def tcl_args(self, formats=None) -> list[str]:
-        return self.format_objects(
-            [
-                "    patch",
-                "quad",
-                self.mat,
-                self.nfIJ,
-                self.nfJK,
-                self.yI,
-                self.zI,
-                self.yJ,
-                self.zJ,
-                self.yK,
-                self.zK,
-                self.yL,
-                self.zL,
-            ],
-            formats,
+    _command = "patch quad"
+
+    def _values(self) -> tuple:
+        return (
+            self.mat,
+            self.nfIJ,
+            self.nfJK,
+            self.yI,
+            self.zI,
+            self.yJ,
+            self.zJ,
+            self.yK,
+            self.zK,
+            self.yL,
+            self.zL,
         )
 
 
@@ -167,25 +261,154 @@ class patch_rect(FiberSectionCommand):
     yJ: float
     zJ: float
 
+    _command = "patch rect"
+
+    def _values(self) -> tuple:
+        return (
+            self.mat,
+            self.nfY,
+            self.nfZ,
+            self.yI,
+            self.zI,
+            self.yJ,
+            self.zJ,
+        )
+
+
+@dataclasses.dataclass
+class fibers(FiberSectionCommand):
+    """Block of individual fibers, stored as arrays.
+
+    Renders the same as a series of `fiber` commands, but keeps the fiber data
+    in four contiguous arrays rather than one object per fiber. Useful for
+    sections with many fibers. Scalar arguments are broadcast against the
+    others.
+
+    Parameters
+    ----------
+    y : array_like
+        Local y-coordinates of the fibers.
+    z : array_like
+        Local z-coordinates of the fibers.
+    A : array_like
+        Areas of the fibers.
+    mat : array_like
+        Tags of the uniaxial materials to use.
+    """
+
+    y: np.ndarray
+    z: np.ndarray
+    A: np.ndarray
+    mat: np.ndarray
+
+    _command = "fiber"
+    # The arrays can be modified in place without any attribute assignment.
+    _cacheable = False
+
+    def __post_init__(self):
+        super().__post_init__()
+        arrays = np.broadcast_arrays(
+            np.asarray(self.y, dtype=float),
+            np.asarray(self.z, dtype=float),
+            np.asarray(self.A, dtype=float),
+            np.asarray(self.mat, dtype=int),
+        )
+        self.y, self.z, self.A, self.mat = [np.ravel(a) for a in arrays]
+
+    def __len__(self):
+        return self.y.size
+
+    def __eq__(self, other):
+        # The generated __eq__ would compare the arrays as tuples, which fails
+        # for arrays of more than one element.
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            np.array_equal(self.y, other.y)
+            and np.array_equal(self.z, other.z)
+            and np.array_equal(self.A, other.A)
+            and np.array_equal(self.mat, other.mat)
+        )
+
+    # Arrays are mutable, so blocks are unhashable like other dataclasses.
+    __hash__ = None
+
+    def _rows(self):
+        """Iterate over the (y, z, A, mat) values of each fiber."""
+        return zip(self.y.tolist(), self.z.tolist(), self.A.tolist(), self.mat.tolist())
+
     def tcl_args(self, formats=None) -> list[str]:
-        return self.format_objects(
-            [
-                "    patch",
-                "rect",
-                self.mat,
-                self.nfY,
-                self.nfZ,
-                self.yI,
-                self.zI,
-                self.yJ,
-                self.zJ,
-            ],
-            formats,
+        """Return the formatted arguments of every fiber command in the block,
+        one command after another."""
+        args = []
+        for row in self._rows():
+            args.extend(self.format_objects([self._command, *row], formats))
+        return args
+
+    def _emit(self, out: list[str], format_spec: MultiFormatSpec, indent: str = ""):
+        # Every row has the same types, so the specs only need to be looked up
+        # once for the whole block.
+        get_format = format_spec.get_format
+        specs = (get_format(0.0), get_format(0.0), get_format(0.0), get_format(0))
+        if len(self) > _FIBER_BLOCK_VECTORIZE_THRESHOLD and self._emit_printf(
+            out, specs, indent
+        ):
+            return
+
+        rows = self._rows()
+        # Bind the per-line callables once; this loop can run many times.
+        format_line = self._format_line
+        extend = out.extend
+        for row in rows:
+            extend((indent, format_line(row, specs), "\n"))
+
+    def _emit_printf(self, out: list[str], specs: tuple[str, ...], indent: str) -> bool:
+        """Format the whole block with one printf-style operation.
+
+        Returns False, without modifying `out`, if the specs have no
+        printf-style equivalent.
+        """
+        directives = [
+            _printf_spec(spec, cls)
+            for spec, cls in zip(specs, (float, float, float, int))
+        ]
+        if None in directives:
+            return False
+
+        prefix = f"{indent}{self._command}".replace("%", "%%")
+        line = f"{prefix} {' '.join(directives)}\n"
+        # Interleave the columns as Python objects so '%d' sees ints and the
+        # float directives see floats.
+        table = np.empty((len(self), 4), dtype=object)
+        table[:, 0] = self.y
+        table[:, 1] = self.z
+        table[:, 2] = self.A
+        table[:, 3] = self.mat
+        out.append((line * len(self)) % tuple(table.ravel().tolist()))
+        return True
+
+
+def _flatten_coords(coords: tuple, num_vertices: int, command: str) -> list:
+    """Flatten patch vertex coordinates given as 2-tuples and/or scalars."""
+    flat = [
+        c
+        for vertex in coords
+        for c in (
+            vertex
+            if isinstance(vertex, Iterable) and not isinstance(vertex, str)
+            else (vertex,)
         )
+    ]
+    if len(flat) != 2 * num_vertices:
+        raise ValueError(
+            f"{command}: coords must either be {num_vertices} 2-tuples "
+            f"or {2 * num_vertices} coordinates"
+        )
+    return flat
 
 
 @dataclasses.dataclass
-class Fiber(Section):
+class Fiber(Section, base._CachedTclCode):
     """Fiber-based section.
 
     Commands that define the fibers can be passed in at construction or created
@@ -200,6 +423,14 @@ class Fiber(Section):
     commands : list, optional
         List of commands that make up the section. (default: [])
 
+    Notes
+    -----
+    The generated Tcl code is cached, since fiber sections can be large and are
+    often rendered more than once. The cache is only used while the section and
+    its commands are unchanged. Sections containing `fibers` blocks, objects
+    other than fiber commands and str, or commands with their own format
+    specifiers are never cached.
+
     Example
     -------
     >>> ops.section.Fiber(1).fiber(0, 1, 1.0, 2).fiber(0, -1, 1.0, 2)
@@ -209,6 +440,14 @@ class Fiber(Section):
     GJ: float = None
     commands: list[FiberSectionCommand] = dataclasses.field(default_factory=list)
 
+    def clear_cache(self):
+        """Clear the cached Tcl code."""
+        self._tcl_code_cache().clear()
+
+    def _add_command(self, command: FiberSectionCommand):
+        self.commands.append(command)
+        return self
+
     def fiber(self, y, z, A, mat):
         """Add a single fiber.
 
@@ -225,8 +464,33 @@ class Fiber(Section):
         mat : int
             Tag of the uniaxial material to use.
         """
-        self.commands.append(fiber(y, z, A, mat))
-        return self
+        return self._add_command(fiber(y, z, A, mat))
+
+    def fibers(self, y, z, A, mat):
+        """Add many fibers at once from arrays.
+
+        The fibers are stored in a single `fibers` block command instead of one
+        `fiber` command each. Scalar arguments are broadcast against the others.
+
+        Returns `self` to allow chained commands.
+
+        Parameters
+        ----------
+        y : array_like
+            Local y-coordinates of the fibers.
+        z : array_like
+            Local z-coordinates of the fibers.
+        A : array_like
+            Areas of the fibers.
+        mat : array_like
+            Tags of the uniaxial materials to use.
+
+        Example
+        -------
+        >>> y = np.linspace(-5.0, 5.0, 11)
+        >>> ops.section.Fiber(1).fibers(y, 0.0, 0.5, 2)
+        """
+        return self._add_command(fibers(y, z, A, mat))
 
     def patch_quad(self, mat, nfIJ, nfJK, *coords):
         """Add a quadrilateral shaped patch.
@@ -251,22 +515,11 @@ class Fiber(Section):
 
         Ref: opensees.berkeley.edu/wiki/index.php/Patch_Command
         """
-        if len(coords) == 4:
-            yI, zI = coords[0]
-            yJ, zJ = coords[1]
-            yK, zK = coords[2]
-            yL, zL = coords[3]
-        elif len(coords) == 8:
-            yI, zI, yJ, zJ, yK, zK, yL, zL = coords
-        else:
-            raise ValueError(
-                "patch_quad: coords must either be 4 2-tuples or 8 coordinates"
-            )
+        yI, zI, yJ, zJ, yK, zK, yL, zL = _flatten_coords(coords, 4, "patch_quad")
 
-        self.commands.append(
+        return self._add_command(
             patch_quad(mat, nfIJ, nfJK, yI, zI, yJ, zJ, yK, zK, yL, zL)
         )
-        return self
 
     def patch_rect(self, mat, nfY, nfZ, *coords):
         """Add a rectangular patch of fibers.
@@ -290,30 +543,97 @@ class Fiber(Section):
 
         Ref: opensees.berkeley.edu/wiki/index.php/Patch_Command
         """
-        if len(coords) == 2:
-            yI, zI = coords[0]
-            yJ, zJ = coords[1]
-        elif len(coords) == 4:
-            yI, zI, yJ, zJ = coords
-        else:
-            raise ValueError(
-                "patch_rect: coords must either be 2 2-tuples or 4 coordinates"
-            )
-
-        self.commands.append(patch_rect(mat, nfY, nfZ, yI, zI, yJ, zJ))
-        return self
+        yI, zI, yJ, zJ = _flatten_coords(coords, 2, "patch_rect")
+
+        return self._add_command(patch_rect(mat, nfY, nfZ, yI, zI, yJ, zJ))
+
+    def _cache_state(self) -> Optional[tuple]:
+        """Snapshot of the commands to check cached code against, or None if the
+        code can't be cached."""
+        section_spec = self._format_spec
+        state = []
+        for cmd in self.commands:
+            if isinstance(cmd, str):
+                state.append(id(cmd))
+            elif (
+                isinstance(cmd, FiberSectionCommand)
+                and cmd._cacheable
+                and cmd._format_spec is section_spec
+            ):
+                # Compared by identity and version: a command that is replaced,
+                # even by an equal-looking one, or modified invalidates the code.
+                state.append((id(cmd), cmd.__dict__.get("_version")))
+            else:
+                return None
+        return tuple(state)
+
+    def _cached_code(self, format_spec: MultiFormatSpec) -> Optional[str]:
+        """Return the cached code for `format_spec`, or None if there is none or
+        the commands have changed since it was generated."""
+        cached = self._tcl_code_cache().get(format_spec.key())
+        if cached is None:
+            return None
+        state, _, code = cached
+        if state == self._cache_state():
+            return code
+        return None
 
     def tcl_code(self, formats=None) -> str:
-        args = ["section", "Fiber", self.tag]
+        format_spec = self._resolve_format_spec(formats)
+        code = self._cached_code(format_spec)
+        if code is None:
+            code = "".join(self._tcl_parts(format_spec, formats))
+            state = self._cache_state()
+            if state is not None:
+                # Holding on to the commands keeps their ids from being reused.
+                entry = (state, tuple(self.commands), code)
+                self._tcl_code_cache()[format_spec.key()] = entry
+        return code
+
+    def _tcl_parts(
+        self, format_spec: MultiFormatSpec, formats: SpecLike = None
+    ) -> list[str]:
+        # Accumulate every piece of the section into one list, rather than
+        # building (and then re-joining) a str per command. Commands normally
+        # share the section's format spec (usually the global one), in which
+        # case the spec resolved here is reused rather than resolved per command.
+        section_spec = self._format_spec
+        get_format = format_spec.get_format
+        parts = [_SECTION_FIBER, format(self.tag, get_format(self.tag))]
         if self.GJ is not None:
-            args.append("-GJ")
-            args.append(self.GJ)
-        args.append("{")
-        section_command = " ".join(self.format_objects(args, formats))
-
-        code = [
-            section_command,
-            *self.commands,
-            "}",
-        ]
-        return "\n".join(self.format_objects(code, formats))
+            parts.extend((" -GJ ", format(self.GJ, get_format(self.GJ))))
+        parts.append(" {\n")
+        for cmd in self.commands:
+            if isinstance(cmd, FiberSectionCommand):
+                if cmd._format_spec is section_spec:
+                    cmd._emit(parts, format_spec, "    ")
+                else:
+                    cmd._emit(parts, cmd._resolve_format_spec(formats), "    ")
+            elif isinstance(cmd, str):
+                # Raw Tcl, e.g. for commands without a wrapper like 'layer'.
+                parts.extend((cmd, "\n"))
+            else:
+                parts.extend((cmd.tcl_code(formats), "\n"))
+        parts.append("}")
+        return parts
+
+    def dump(self, fid: TextIO, formats: SpecLike = None):
+        """Write the Tcl code for this section to the given file descriptor.
+
+        Unless the code is already cached, the pieces are written directly
+        instead of first being joined into one (potentially very large) str.
+
+        Parameters
+        ----------
+        fid
+            File-like object to write to.
+        formats : SpecLike
+            Format specifiers to use instead of the defaults.
+        """
+        format_spec = self._resolve_format_spec(formats)
+        code = self._cached_code(format_spec)
+        if code is not None:
+            fid.write(code)
+        else:
+            fid.writelines(self._tcl_parts(format_spec, formats))
+        fid.write("\n")
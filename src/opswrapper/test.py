@@ -1,7 +1,8 @@
 import dataclasses
 from enum import IntEnum
+from typing import ClassVar
 
-from .base import OpenSeesObject
+from .base import _CachedTclCode
 
 # Most of the test commands share the same signature. Document parameters here
 # to reduce repetition.
@@ -47,20 +48,52 @@ class PrintFlag(IntEnum):
 
 
 @dataclasses.dataclass
-class Test(OpenSeesObject):
+class Test(_CachedTclCode):
     tolerance: float
     max_iters: int
     print_flag: int = PrintFlag.NOTHING
     norm_type: int = 2
 
+    # Name of the test in Tcl; the same as the class name.
+    _METHOD: ClassVar[str] = "Test"
+    # Constant start of the Tcl command, e.g. 'test NormUnbalance '.
+    _PREFIX: ClassVar[str] = "test Test "
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._METHOD = cls.__name__
+        cls._PREFIX = f"test {cls.__name__} "
+        if cls.__doc__:
+            cls.__doc__ = cls.__doc__.replace(
+                "%(parameters)s", _standard_test_parameters
+            )
+
+    def __setattr__(self, name, value):
+        # Validate the print flag once, on assignment, instead of on every
+        # render. This also covers the assignment in __init__.
+        if name == "print_flag":
+            value = PrintFlag(value)
+        super().__setattr__(name, value)
+
+    def _values(self) -> list:
+        return [self.tolerance, self.max_iters, self.print_flag, self.norm_type]
+
     def tcl_code(self, formats=None) -> str:
-        return " ".join(["test", *self.tcl_args(formats=formats)])
+        # Cached by the contents of the format spec in use. The same test object
+        # is often embedded in many analysis scripts.
+        cache = self._tcl_code_cache()
+        key = self._resolve_format_spec(formats).key()
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        code = self._PREFIX + self.format_line(self._values(), formats)
+        cache[key] = code
+        return code
 
     def tcl_args(self, formats=None) -> list[str]:
-        method = self.__class__.__name__
-        print_flag = PrintFlag(self.print_flag)
-        args = [method, self.tolerance, self.max_iters, print_flag, self.norm_type]
-        return self.format_objects(args, formats)
+        return [self._METHOD, *self.format_objects(self._values(), formats)]
 
 
 @dataclasses.dataclass
@@ -279,7 +312,3 @@ class RelativeEnergyIncr(Test):
 
         [ΔUi * R(Ui)] / [ΔU0 * R(U0)] < tol
     """
-
-
-for subclass in Test.__subclasses__():
-    subclass.__doc__ %= {"parameters": _standard_test_parameters}
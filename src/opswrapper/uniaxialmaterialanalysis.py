@@ -10,9 +10,14 @@ from . import element
 from . import test
 from . import utils
 from .analysis import OpenSeesAnalysis
+from .base import OpenSeesObject
 from .output import ElementRecorder
 from .model import Model, Node
 
+# Number of imposed displacement values formatted at a time when writing the
+# load pattern file.
+_PATTERN_CHUNK_SIZE = 65536
+
 
 class UniaxialMaterialAnalysis(OpenSeesAnalysis):
     """Analyze an OpenSees uniaxial material via imposed displacement/strain.
@@ -55,12 +60,15 @@ class UniaxialMaterialAnalysis(OpenSeesAnalysis):
 
     def _process_material_definition(self):
         """Sanitize the given material definition into a list of str."""
+        material = self.material
+        # Check for single definitions explicitly: a str is itself iterable.
+        if isinstance(material, (str, OpenSeesObject)):
+            return [str(material)]
         try:
-            matdef = [str(m) for m in self.material]
+            return [str(m) for m in material]
         except TypeError:
-            matdef = [str(self.material)]
-
-        return matdef
+            # Any other single definition, e.g. a custom object with __str__.
+            return [str(material)]
 
     def run_analysis(
         self,
@@ -91,7 +99,7 @@ class UniaxialMaterialAnalysis(OpenSeesAnalysis):
 
         >>> results = analysis.run_analysis([0, 1, -1, 2, -2], 'Steps', 100)
         """
-        peak_points = np.array(peak_points)
+        peak_points = np.asarray(peak_points, dtype=float)
         results = xr.Dataset()
 
         # Filenames
@@ -137,9 +145,15 @@ class UniaxialMaterialAnalysis(OpenSeesAnalysis):
             "exit 1",
         ]
 
-        # Write files to disk
-        np.savetxt(files["pattern"], numbers)
-        script = "\n".join(str(line) for line in model)
+        # Write files to disk. The pattern is formatted with one printf-style
+        # operation per chunk rather than row-by-row as `np.savetxt` does;
+        # chunking bounds the memory used for very long histories. '%.17g' is
+        # the shortest fixed precision that round-trips a float64 exactly.
+        with open(files["pattern"], "w") as fid:
+            for start in range(0, numbers.size, _PATTERN_CHUNK_SIZE):
+                chunk = numbers[start : start + _PATTERN_CHUNK_SIZE].tolist()
+                fid.write(("%.17g\n" * len(chunk)) % tuple(chunk))
+        script = "\n".join(map(str, model))
         files["input"].write_text(script)
 
         # Run the analysis
@@ -156,16 +170,17 @@ class UniaxialMaterialAnalysis(OpenSeesAnalysis):
                 f"Analysis ended in an unknown manner, exit code: {process.returncode}"
             )
 
-        # Read results
-        disp = np.loadtxt(files["output_disp"])
+        # Read results. Only the force at the second node is used, so skip
+        # parsing the first column entirely.
+        disp = np.loadtxt(files["output_disp"], ndmin=1)
         results["disp"] = xr.DataArray(disp, dims="time")
 
-        force = np.loadtxt(files["output_force"])
-        results["force"] = xr.DataArray(force[:, 1], dims="time")
+        force = np.loadtxt(files["output_force"], usecols=1, ndmin=1)
+        results["force"] = xr.DataArray(force, dims="time")
 
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            stiff = np.loadtxt(files["output_stiff"])
+            stiff = np.loadtxt(files["output_stiff"], ndmin=1)
         if len(stiff) != 0:
             results["stiff"] = xr.DataArray(stiff, dims="time")
 
@@ -173,6 +188,11 @@ class UniaxialMaterialAnalysis(OpenSeesAnalysis):
         results.attrs["script"] = script
         results.attrs["stdout"] = process.stdout
 
+        # Everything has been read back in; remove the scratch directory in one
+        # pass now rather than leaving it to the finalizer.
+        if self.delete_files:
+            scratch_file.cleanup()
+
         return results
 
     @staticmethod
@@ -180,14 +200,20 @@ class UniaxialMaterialAnalysis(OpenSeesAnalysis):
         if rate_type is not None and rate_value is None:
             raise TypeError("rate_value must be specified if rate_type is not None")
 
-        rate = {
-            "StrainRate": lambda: rate_value,
-            "Steps": lambda: np.sum(np.abs(np.diff(peak_points))) / rate_value,
-            None: lambda: np.max(np.abs(np.diff(peak_points))),
-        }[rate_type]()
+        peak_points = np.asarray(peak_points, dtype=float)
+        if rate_type is None:
+            # No interpolation: filling at a rate equal to the largest step
+            # would only reproduce the peaks, so skip it.
+            numbers = peak_points.ravel()
+        else:
+            rate = {
+                "StrainRate": lambda: rate_value,
+                "Steps": lambda: np.sum(np.abs(np.diff(peak_points))) / rate_value,
+            }[rate_type]()
+            numbers = fill_out_numbers(peak_points, rate).ravel()
 
-        numbers = fill_out_numbers(peak_points, rate).flatten()
-        return np.array([numbers[0], *numbers, numbers[-1]])
+        # Repeat the first and last points
+        return np.pad(numbers, 1, mode="edge")
 
 
 def fill_out_numbers(peaks, rate):
@@ -214,25 +240,61 @@ def fill_out_numbers(peaks, rate):
 
     Ported from the MATLAB function written by Mark Denavit.
     """
-    peaks = np.array(peaks)
+    # Only read from below, so there is no need to copy an existing float array.
+    peaks = np.asarray(peaks, dtype=float)
 
-    if len(peaks.shape) == 1:
-        peaks = peaks.reshape(peaks.size, 1)
-
-    if peaks.shape[0] == 1:
+    if peaks.ndim == 1:
+        peaks = peaks[:, np.newaxis]
+    elif peaks.shape[0] == 1:
+        # A single row is one series of peaks, not one point of several.
         peaks = peaks.T
 
-    numpeaks = peaks.shape[0]
-    numbers = [peaks[0, :]]
-
-    for i in range(numpeaks - 1):
-        diff = peaks[i + 1, :] - peaks[i, :]
-        numsteps = int(np.maximum(2, 1 + np.ceil(np.max(np.abs(diff / rate)))))
-        numbers_to_add = np.linspace(peaks[i, :], peaks[i + 1, :], numsteps)
-        numbers.append(numbers_to_add[1:, :])
+    # Number of points in each segment, including both of its endpoints.
+    diffs = np.diff(peaks, axis=0)
+    numsteps = np.maximum(2, 1 + np.ceil(np.max(np.abs(diffs / rate), axis=1)))
+    if not np.all(np.isfinite(numsteps)):
+        raise ValueError(f"fill_out_numbers: invalid rate {rate!r} for the given peaks")
+    counts = numsteps.astype(int) - 1
+    step = diffs / counts[:, np.newaxis]
+
+    # Build every segment at once, excluding each segment's starting point,
+    # which is the previous segment's end. `k` counts 1..counts[i] within
+    # segment i. The arithmetic mirrors np.linspace so the results are
+    # identical to filling each segment separately.
+    segment = np.repeat(np.arange(counts.size), counts)
+    ends = np.cumsum(counts)
+    total = counts.sum()
+    # Built as float from the start and offset in place, which saves two
+    # output-sized temporaries on long histories. Counts are integers far
+    # below 2**53, so this is exact.
+    k = np.arange(1.0, total + 1.0)
+    k -= np.repeat(ends - counts, counts)
+    k = k[:, np.newaxis]
+
+    # Write straight into the output buffer rather than concatenating the
+    # first peak onto the filled-in points afterwards. The steps are gathered
+    # into it directly, too, and then scaled in place.
+    numbers = np.empty((total + 1, peaks.shape[1]))
+    numbers[0] = peaks[0]
+    filled = numbers[1:]
+    np.take(step, segment, axis=0, out=filled, mode="clip")
+    filled *= k
+    # np.linspace divides first, then scales by the difference, when any step
+    # in a segment is zero. Check per segment first; expanding to every point
+    # is only needed if some segment actually has a zero step.
+    zero_rows = np.any(step == 0, axis=1)
+    if zero_rows.any():
+        zero_step = zero_rows[segment]
+        zero_segment = segment[zero_step]
+        filled[zero_step] = (
+            k[zero_step] / counts[zero_segment, np.newaxis] * diffs[zero_segment]
+        )
+    filled += peaks[segment]
+    filled[ends - 1] = peaks[1:]
 
-    numbers = np.vstack(numbers)
-    if 1 in numbers.shape:
-        numbers = numbers.flatten()
+    # A single series comes back 1-D. The output is freshly allocated and
+    # contiguous, so ravel() returns a view instead of copying like flatten().
+    if peaks.shape[1] == 1:
+        numbers = numbers.ravel()
 
     return numbers
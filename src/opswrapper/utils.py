@@ -1,29 +1,62 @@
 import dataclasses
+import functools
 import numbers
 import os
-from pathlib import Path
 from typing import Callable, Generic, Iterable, Mapping, TypeVar, Union
 
 StrPath = Union[str, os.PathLike[str]]
 
 
-def coerce_numeric(obj, to_type: type):
-    """Gently attempt to coerce between numeric types."""
+@functools.lru_cache(maxsize=256)
+def _is_numeric_target(to_type: type) -> bool:
+    """Return True if `coerce_numeric` should try to coerce to `to_type`.
+
+    Cached since the same few field types are checked over and over, and the
+    `numbers.Number` ABC check is comparatively slow.
+    """
     # If to_type is a parameterized generic, issubclass() freaks out
     # in an unhelpful way. isinstance(to_type, type) returns True,
     # so I guess the only thing to do is check if to_type has
     # annotations.
     if hasattr(to_type, "__args__"):
-        return obj
+        return False
 
     # Only try to coerce *to* numbers
-    if not issubclass(to_type, numbers.Number):
-        return obj
+    return issubclass(to_type, numbers.Number)
+
+
+@functools.lru_cache(maxsize=256)
+def _is_number_type(obj_type: type) -> bool:
+    """Return True if instances of `obj_type` are numbers that `coerce_numeric`
+    may coerce *from*.
+
+    Cached per type, so that e.g. NumPy scalars only go through the
+    `numbers.Number` ABC check once.
+    """
+    return issubclass(obj_type, numbers.Number)
+
 
-    # Only try to coerce *from* numbers
-    if not isinstance(obj, numbers.Number):
+# Common concrete numeric types. Conversions between these are handled without
+# consulting the comparatively slow `numbers.Number` ABC.
+_CONCRETE_NUMBERS = frozenset((bool, int, float, complex))
+
+
+def coerce_numeric(obj, to_type: type):
+    """Gently attempt to coerce between numeric types."""
+    obj_type = obj.__class__
+
+    # Already the right type; nothing to do.
+    if obj_type is to_type:
         return obj
 
+    if to_type not in _CONCRETE_NUMBERS or obj_type not in _CONCRETE_NUMBERS:
+        if not _is_numeric_target(to_type):
+            return obj
+
+        # Only try to coerce *from* numbers
+        if not _is_number_type(obj_type):
+            return obj
+
     # If coercion doesn't work, just return the original object.
     try:
         coerced = to_type(obj)
@@ -34,19 +67,29 @@ def coerce_numeric(obj, to_type: type):
 
 
 def path_for_tcl(path: StrPath) -> str:
-    return Path(path).as_posix()
+    """Convert a path to a string with forward slashes, as Tcl expects."""
+    # Equivalent to Path(path).as_posix() as far as Tcl is concerned, without
+    # constructing (and parsing) a Path object.
+    path = os.fspath(path)
+    if os.sep != "/":
+        path = path.replace(os.sep, "/")
+    return path
+
 
+# Translation table for `tclescape`: backslash-escape each Tcl metacharacter.
+_TCL_ESCAPE = str.maketrans({c: "\\" + c for c in R'\[$"'})
 
+
+# Model scripts tend to escape the same short strings (file names, flags,
+# numbers in lists) over and over.
+@functools.lru_cache(maxsize=4096)
 def tclescape(text: str) -> str:
     """Escape a string for use as a literal in Tcl."""
     # Based on:
-    # - https://stackoverflow.com/a/27086669 (fast Python algorithms for doing this)
     # - https://stackoverflow.com/a/70082148 (which characters actually need escaping?)
-    chars = R'\[$"'
-    for c in chars:
-        if c in text:
-            text = text.replace(c, "\\" + c)
-    return f'"{text}"'
+    # A single `str.translate` pass replaces the per-character `str.replace`
+    # scans suggested by https://stackoverflow.com/a/27086669.
+    return f'"{text.translate(_TCL_ESCAPE)}"'
 
 
 def tcllist(it: Iterable[object], stringify: Callable[[object], str] = str) -> str:
@@ -68,8 +111,12 @@ def tcllist(it: Iterable[object], stringify: Callable[[object], str] = str) -> s
     >>> tcllist([1.0, 2, "sam's the best!", "[this_wont_run]", "$no_substitutes"])
     '[list "1.0" "2" "sam\'s the best!" "\\[this_wont_run]" "\\$no_substitutes"]'
     """
-    return f"[list {' '.join(tclescape(stringify(i)) for i in it)}]"
+    escape = tclescape  # local name; avoids a global lookup per element
+    return f"[list {' '.join([escape(stringify(i)) for i in it])}]"
+
 
+# Sentinel for missing dispatch keys, since None is a valid dispatch value.
+_MISSING = object()
 
 KT = TypeVar("KT")
 VT = TypeVar("VT")
@@ -102,11 +149,8 @@ class ValueTypeDispatch(Generic[KT, VT]):
     dispatch: Mapping[KT, VT]
 
     def __getitem__(self, key: KT) -> VT:
-        try:
-            value = self.dispatch[key]
-        except KeyError as exc:
+        value = self.dispatch.get(key, _MISSING)
+        if value is _MISSING:
             valid = list(self.dispatch)
-            raise TypeError(
-                f"Invalid {self.name} {key!r}; must be one of {valid!r}"
-            ) from exc
+            raise TypeError(f"Invalid {self.name} {key!r}; must be one of {valid!r}")
         return value
@@ -116,7 +116,8 @@ def squawk(*args, sep=None, end=None, file=None):
     if file is None:
         file = sys.stderr
 
-    if _COLOR:
+    # Color codes are only useful on a terminal; keep them out of logs.
+    if _COLOR and file.isatty():
         print(Fore.BLUE + str(args[0]),
               *args[1:],
               Style.RESET_ALL,
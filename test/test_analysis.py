@@ -0,0 +1,23 @@
+import sys
+
+import pytest
+
+from opswrapper.analysis import OpenSeesAnalysis
+
+
+@pytest.mark.parametrize("echo", [False, True])
+def test_run_opensees_output(tmp_path, capsys, echo):
+    if sys.platform == "win32":
+        pytest.skip()
+
+    fake_opensees = tmp_path / "OpenSees"
+    fake_opensees.write_text('#!/bin/sh\necho "running $1"\necho oops >&2\nexit 2\n')
+    fake_opensees.chmod(0o755)
+
+    analysis = OpenSeesAnalysis(opensees_path=fake_opensees)
+    results = analysis.run_opensees("model.tcl", echo=echo)
+
+    expected = "running model.tcl\noops\n"
+    assert results.returncode == 2
+    assert results.stdout == expected
+    assert capsys.readouterr().out == (expected if echo else "")
@@ -39,3 +39,10 @@ def test_HHT_default():
 def test_HHT_non_default():
     generated = integrator.HHT(0.9, 0.3025).tcl_code()
     assert generated == "integrator HHT 0.9 0.3025 0.6"
+
+
+def test_Newmark_tcl_args():
+    newmark = integrator.Newmark(0.5, 0.25)
+    assert newmark.tcl_args() == ["Newmark", "0.5", "0.25"]
+    assert newmark.tcl_args({float: ".2f"}) == ["Newmark", "0.50", "0.25"]
+    assert newmark.tcl_code({float: ".2f"}) == "integrator Newmark 0.50 0.25"
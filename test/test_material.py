@@ -1,3 +1,7 @@
+import dataclasses
+import io
+import pickle
+
 from opswrapper import material
 
 
@@ -90,3 +94,101 @@ def test_Steel02_initial_stress():
     generated_code = material.Steel02(1, 50, 29000, 0.003, sigma_i=15).tcl_code()
     expected_code = "uniaxialMaterial Steel02 1 50 29000 0.003 20 0.925 0.15 0 1 0 1 15"
     assert generated_code == expected_code
+
+
+def test_elastic_dump():
+    fid = io.StringIO()
+    material.Elastic(1, 29000).dump(fid, {float: ".2e"})
+    assert fid.getvalue() == "uniaxialMaterial Elastic 1 2.90e+04\n"
+
+
+def test_str_tracks_changes():
+    steel = material.Steel01(1, 50.0, 29000.0, 0.01)
+    assert str(steel) == "uniaxialMaterial Steel01 1 50 29000 0.01"
+    steel.Fy = 60.0
+    assert str(steel) == "uniaxialMaterial Steel01 1 60 29000 0.01"
+    steel.set_format_spec({float: ".1f"})
+    assert str(steel) == "uniaxialMaterial Steel01 1 60.0 29000.0 0.0"
+    steel.Fy = 60
+    assert str(steel) == "uniaxialMaterial Steel01 1 60 29000.0 0.0"
+
+
+def test_format_line():
+    elastic = material.Elastic(1, 29000.0)
+    objects = ["-mass", 1, 2.5e-3, "$var", True, elastic]
+    for formats in [None, {float: "#.3g", int: "4d"}, {float: "<10"}]:
+        generated = elastic.format_line(objects, formats)
+        expected = " ".join(elastic.format_objects(objects, formats))
+        assert generated == expected
+        assert elastic.format_line(objects[:4], formats) == " ".join(
+            elastic.format_objects(objects[:4], formats)
+        )
+
+
+def test_Steel02_tcl_args():
+    steel = material.Steel02(1, 50, 29000, 0.003, sigma_i=5.0)
+    expected_args = ["Steel02", "1", "50", "29000", "0.003", "20", "0.925", "0.15"]
+    expected_args += ["0", "1", "0", "1", "5"]
+    assert steel.tcl_args() == expected_args
+    assert steel.tcl_code({int: "4d"}) == "uniaxialMaterial " + " ".join(
+        steel.tcl_args({int: "4d"})
+    )
+
+
+def test_override_tracks_stored_spec():
+    elastic = material.Elastic(1, 29000.0)
+    assert elastic.tcl_code({int: "3d"}) == "uniaxialMaterial Elastic   1 29000"
+    elastic.set_format_spec({float: ".1f"})
+    assert elastic.tcl_code({int: "3d"}) == "uniaxialMaterial Elastic   1 29000.0"
+    assert elastic.tcl_code({float: "g"}) == "uniaxialMaterial Elastic 1 29000"
+
+
+def test_str_signed_zero():
+    elastic = material.Elastic(1, 0.0)
+    assert str(elastic) == "uniaxialMaterial Elastic 1 0"
+    elastic.E = -0.0
+    assert str(elastic) == elastic.tcl_code() == "uniaxialMaterial Elastic 1 -0"
+
+
+def test_str_cache_not_in_state():
+    elastic = material.Elastic(1, 29000.0)
+    str(elastic)
+    assert vars(elastic) == {"tag": 1, "E": 29000.0, "eta": 0.0, "Eneg": None}
+    restored = pickle.loads(pickle.dumps(elastic))
+    assert restored == elastic
+    assert str(restored) == "uniaxialMaterial Elastic 1 29000"
+
+
+def test_format_iterators():
+    elastic = material.Elastic(1, 29000.0)
+    objects = [1, 2, "a"]
+    assert elastic.format_objects(iter(objects)) == ["1", "2", "a"]
+    assert elastic.format_line(iter(objects)) == "1 2 a"
+    assert elastic.get_object_formats(x for x in (1, 2.0)) == ["d", ".12g"]
+
+
+def test_subclass_overriding_tcl_args():
+    @dataclasses.dataclass
+    class Custom(material.UniaxialMaterial):
+        E: float
+
+        def tcl_args(self, formats=None):
+            return self.format_objects(["Custom", self.tag, self.E], formats)
+
+    custom = Custom(1, 29000.0)
+    assert custom.tcl_code() == "uniaxialMaterial Custom 1 29000"
+    assert str(custom) == "uniaxialMaterial Custom 1 29000"
+    assert custom.tcl_code({int: "3d"}) == "uniaxialMaterial Custom   1 29000"
+
+
+def test_concrete_subclass_overriding_tcl_args():
+    @dataclasses.dataclass
+    class MySteel(material.Steel01):
+        extra: int = 1
+
+        def tcl_args(self, formats=None):
+            return [*super().tcl_args(formats), "-extra", f"{self.extra:d}"]
+
+    steel = MySteel(1, 50, 29000, 0.01)
+    assert steel.tcl_code() == "uniaxialMaterial Steel01 1 50 29000 0.01 -extra 1"
+    assert str(steel) == steel.tcl_code()
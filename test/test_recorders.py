@@ -33,6 +33,51 @@ def test_node_recorder_pass_array():
     assert generated == expected
 
 
+def test_node_recorder_pass_float_array_and_variables():
+    recorder = NodeRecorder(
+        file="/tmp/Scratch/displacement.dat",
+        nodes=np.array([1.0, 2.0]),
+        dofs=["$dof", 2],
+        response="disp",
+    )
+    generated = recorder.tcl_code()
+    expected = (
+        'recorder Node -file "/tmp/Scratch/displacement.dat" -node 1 2 -dof $dof 2 disp'
+    )
+    assert generated == expected
+
+
+def test_node_recorder_huge_tags():
+    recorder = NodeRecorder(
+        file="/tmp/Scratch/displacement.dat",
+        nodes=[1, 2, 1e20],
+        dofs=np.array([1, 2**64 - 1], dtype=np.uint64),
+        response="disp",
+    )
+    generated = recorder.tcl_code()
+    expected = (
+        'recorder Node -file "/tmp/Scratch/displacement.dat" '
+        "-node 1 2 100000000000000000000 -dof 1 18446744073709551615 disp"
+    )
+    assert generated == expected
+
+
+def test_node_recorder_long_array_special_format():
+    recorder = NodeRecorder(
+        file="/tmp/Scratch/displacement.dat",
+        nodes=np.arange(1, 1001),
+        dofs=[1],
+        response="disp",
+    )
+    generated = recorder.tcl_code({int: "04d"})
+    expected = (
+        'recorder Node -file "/tmp/Scratch/displacement.dat" -node '
+        + " ".join(f"{tag:04d}" for tag in range(1, 1001))
+        + " -dof 0001 disp"
+    )
+    assert generated == expected
+
+
 def test_node_recorder_windows_path():
     if sys.platform != "win32":
         pytest.skip()
@@ -1,3 +1,13 @@
+import copy
+import gc
+import io
+import pickle
+import weakref
+
+import numpy as np
+from pytest import raises
+
+from opswrapper import material
 from opswrapper import section
 
 
@@ -37,3 +47,181 @@ def test_Fiber_section():
     generated = section.Fiber(1).fiber(0, -1, 1.0, 2).fiber(0, 1, 1.0, 2).tcl_code()
     expected = "section Fiber 1 {\n    fiber 0 -1 1 2\n    fiber 0 1 1 2\n}"
     assert generated == expected
+
+
+def test_Fiber_section_raw_commands():
+    layer = "    layer straight 1 2 0.5 0 0 1 1"
+    s = section.Fiber(1, commands=[layer, material.Elastic(1, 29000.0)])
+    expected = (
+        "section Fiber 1 {\n"
+        "    layer straight 1 2 0.5 0 0 1 1\n"
+        "uniaxialMaterial Elastic 1 2.9e+04\n"
+        "}"
+    )
+    assert s.tcl_code({float: ".2g"}) == expected
+
+
+def test_Fiber_section_patches_special_format():
+    generated = (
+        section.Fiber(1)
+        .patch_rect(1, 2, 2, (-1, -1), (1, 1))
+        .fiber("$y", 0, 0.5, 2)
+        .tcl_code({float: ".1f"})
+    )
+    expected = (
+        "section Fiber 1 {\n"
+        "    patch rect 1 2 2 -1.0 -1.0 1.0 1.0\n"
+        "    fiber $y 0.0 0.5 2\n"
+        "}"
+    )
+    assert generated == expected
+
+
+def test_Fiber_section_command_format_specs():
+    f = section.fiber(0, 1, 1.0, 2)
+    f.set_format_spec({float: ".2f"})
+    s = section.Fiber(1, commands=[f, section.fiber(0, -1, 1.0, 2)])
+    expected = "section Fiber 1 {\n    fiber 0.00 1.00 1.00 2\n    fiber 0 -1 1 2\n}"
+    assert s.tcl_code() == expected
+
+    old_spec = section.patch_rect.set_class_format_spec({int: "2d"})
+    try:
+        generated = section.Fiber(1).patch_rect(1, 2, 2, 0, 0, 1, 1).tcl_code()
+    finally:
+        section.patch_rect._format_spec = old_spec
+    assert generated == "section Fiber 1 {\n    patch rect  1  2  2 0 0 1 1\n}"
+
+
+def test_Fiber_section_fiber_block():
+    block = section.fibers(np.array([-1.0, 1.0]), 0, 0.5, 2)
+    generated = section.Fiber(1, commands=[block]).fiber(0, 0, 1.0, 3).tcl_code()
+    expected = (
+        "section Fiber 1 {\n"
+        "    fiber -1 0 0.5 2\n"
+        "    fiber 1 0 0.5 2\n"
+        "    fiber 0 0 1 3\n"
+        "}"
+    )
+    assert generated == expected
+
+
+def test_Fiber_section_large_fiber_block():
+    y = np.linspace(-1.0, 1.0, 300)
+    block = section.Fiber(1, commands=[section.fibers(y, 0.25, 1e-3, 2)])
+    individual = section.Fiber(1)
+    for yi in y:
+        individual.fiber(yi, 0.25, 1e-3, 2)
+    assert block.tcl_code() == individual.tcl_code()
+    assert block.tcl_code({float: "{^12"}) == individual.tcl_code({float: "{^12"})
+
+
+def test_Fiber_section_cache_invalidation():
+    s = section.Fiber(1).fiber(0, 1, 1.0, 2)
+    assert s.tcl_code() == "section Fiber 1 {\n    fiber 0 1 1 2\n}"
+    s.fiber(0, -1, 1.0, 2)
+    s.tag = 2
+    assert s.tcl_code() == "section Fiber 2 {\n    fiber 0 1 1 2\n    fiber 0 -1 1 2\n}"
+    s.commands[0].mat = 3
+    s.clear_cache()
+    assert s.tcl_code() == "section Fiber 2 {\n    fiber 0 1 1 3\n    fiber 0 -1 1 2\n}"
+
+
+def test_Fiber_section_cache_replaced_command():
+    s = section.Fiber(1).fiber(0, 1, 1.0, 2)
+    assert s.tcl_code() == "section Fiber 1 {\n    fiber 0 1 1 2\n}"
+    s.commands[0] = section.fiber(0, 1, 1.0, 3)
+    assert s.tcl_code() == "section Fiber 1 {\n    fiber 0 1 1 3\n}"
+
+
+def test_Fiber_section_cache_modified_commands():
+    s = section.Fiber(1).fiber(0, 1, 1.0, 2)
+    s.tcl_code()
+    s.commands[0].y = 5.0
+    assert s.tcl_code() == "section Fiber 1 {\n    fiber 5 1 1 2\n}"
+    assert str(s) == s.tcl_code()
+
+    block = section.Fiber(1).fibers([0.0, 1.0], 0.0, 1.0, 2)
+    block.tcl_code()
+    block.commands[0].y[0] = 5.0
+    assert block.tcl_code().startswith("section Fiber 1 {\n    fiber 5 0 1 2\n")
+
+    elastic = material.Elastic(1, 29000.0)
+    nested = section.Fiber(1, commands=[elastic])
+    nested.tcl_code()
+    elastic.set_format_spec({float: ".1f"})
+    assert (
+        nested.tcl_code() == "section Fiber 1 {\nuniaxialMaterial Elastic 1 29000.0\n}"
+    )
+
+
+def test_Fiber_section_copy_has_own_cache():
+    original = section.Fiber(1).fiber(0, 1, 1.0, 2)
+    assert original.tcl_code() == "section Fiber 1 {\n    fiber 0 1 1 2\n}"
+    copied = copy.copy(original)
+    copied.tag = 5
+    assert copied.tcl_code() == "section Fiber 5 {\n    fiber 0 1 1 2\n}"
+    assert original.tcl_code() == "section Fiber 1 {\n    fiber 0 1 1 2\n}"
+    assert "_tcl_cache" not in pickle.loads(pickle.dumps(original)).__dict__
+
+
+def test_Fiber_section_patch_quad_tuples():
+    generated = (
+        section.Fiber(1).patch_quad(1, 4, 4, (0, 0), (1, 0), (1, 1), (0, 1)).tcl_code()
+    )
+    expected = "section Fiber 1 {\n    patch quad 1 4 4 0 0 1 0 1 1 0 1\n}"
+    assert generated == expected
+
+
+def test_Fiber_section_patch_bad_coords():
+    with raises(ValueError):
+        section.Fiber(1).patch_rect(1, 4, 4, (0, 0, 0), (1, 1))
+
+
+def test_Fiber_section_dump():
+    s = section.Fiber(1, GJ=1e4).fiber(0, -1, 1.0, 2).fiber(0, 1, 1.0, 2)
+    streamed = io.StringIO()
+    s.dump(streamed, {float: ".1f"})
+    assert streamed.getvalue() == s.tcl_code({float: ".1f"}) + "\n"
+
+
+def test_Fiber_section_no_reference_cycle():
+    # Commands must not refer back to their section, so that a section is freed
+    # by reference counting alone.
+    s = section.Fiber(1).fiber(0, 1, 1.0, 2).patch_rect(1, 2, 2, 0, 0, 1, 1)
+    s.tcl_code()
+    ref = weakref.ref(s)
+    gc.disable()
+    try:
+        del s
+        assert ref() is None
+    finally:
+        gc.enable()
+
+
+def test_Fiber_section_fibers_from_arrays():
+    generated = section.Fiber(1).fibers(np.array([-1, 1]), [0, 0], 0.5, 2).tcl_code()
+    expected = "section Fiber 1 {\n    fiber -1 0 0.5 2\n    fiber 1 0 0.5 2\n}"
+    assert generated == expected
+
+
+def test_fibers_equality():
+    block = section.fibers([-1.0, 1.0], 0.0, 0.5, 2)
+    assert block == section.fibers(np.array([-1.0, 1.0]), [0.0, 0.0], 0.5, 2)
+    assert block != section.fibers([-1.0, 2.0], 0.0, 0.5, 2)
+    assert section.Fiber(1).fibers([0, 1], 0, 1.0, 2) == section.Fiber(1).fibers(
+        [0, 1], 0, 1.0, 2
+    )
+
+
+def test_fibers_tcl_args():
+    block = section.fibers([-1.0, 1.0], 0.0, 0.5, 2)
+    expected = ["fiber", "-1", "0", "0.5", "2", "fiber", "1", "0", "0.5", "2"]
+    assert block.tcl_args() == expected
+    assert block.tcl_args({int: "2d"})[4] == " 2"
+
+
+def test_Fiber_section_append_command():
+    s = section.Fiber(1)
+    assert s == section.Fiber(1, commands=[])
+    s.commands.append(section.fiber(0, 1, 1.0, 2))
+    assert s.tcl_code() == "section Fiber 1 {\n    fiber 0 1 1 2\n}"
@@ -1,3 +1,5 @@
+import copy
+
 from pytest import raises
 
 from opswrapper import test
@@ -28,6 +30,29 @@ def test_alternate_format():
 
 
 def test_bad_print_flag():
-    the_test = test.EnergyIncr(1e-4, 50, 8)
     with raises(ValueError):
-        the_test.tcl_code()
+        test.EnergyIncr(1e-4, 50, 8)
+
+    the_test = test.EnergyIncr(1e-4, 50)
+    with raises(ValueError):
+        the_test.print_flag = 8
+
+
+def test_cache_invalidation():
+    the_test = test.NormUnbalance(1e-8, 50)
+    assert the_test.tcl_code() == "test NormUnbalance 1e-08 50 0 2"
+
+    the_test.max_iters = 100
+    assert the_test.tcl_code() == "test NormUnbalance 1e-08 100 0 2"
+
+    the_test.set_format_spec({float: ".2e"})
+    assert the_test.tcl_code() == "test NormUnbalance 1.00e-08 100 0 2"
+
+
+def test_copy_has_own_cache():
+    original = test.NormUnbalance(1e-8, 50)
+    assert original.tcl_code() == "test NormUnbalance 1e-08 50 0 2"
+    copied = copy.copy(original)
+    copied.max_iters = 100
+    assert copied.tcl_code() == "test NormUnbalance 1e-08 100 0 2"
+    assert original.tcl_code() == "test NormUnbalance 1e-08 50 0 2"
@@ -0,0 +1,73 @@
+import numpy as np
+
+from opswrapper import material
+from opswrapper.uniaxialmaterialanalysis import (
+    UniaxialMaterialAnalysis,
+    fill_out_numbers,
+)
+
+
+def test_fill_out_numbers():
+    generated = fill_out_numbers([0, 1, -1], rate=0.25)
+    expected = np.array(
+        [0, 0.25, 0.5, 0.75, 1, 0.75, 0.5, 0.25, 0, -0.25, -0.5, -0.75, -1]
+    )
+    np.testing.assert_array_equal(generated, expected)
+
+
+def test_fill_out_numbers_multiple_columns():
+    generated = fill_out_numbers([[0, 1, -1], [1, 2, -2]], rate=0.25)
+    expected = np.array(
+        [
+            [0.0, 1.0, -1.0],
+            [0.25, 1.25, -1.25],
+            [0.5, 1.5, -1.5],
+            [0.75, 1.75, -1.75],
+            [1.0, 2.0, -2.0],
+        ]
+    )
+    np.testing.assert_array_equal(generated, expected)
+
+
+def test_fill_out_numbers_matches_linspace():
+    peaks = np.array([[0.0, 0.0], [0.3, 0.0], [0.3, -0.7], [-1.1, 0.2]])
+    rate = 0.07
+    expected = [peaks[:1]]
+    for start, stop in zip(peaks[:-1], peaks[1:]):
+        numsteps = int(max(2, 1 + np.ceil(np.max(np.abs((stop - start) / rate)))))
+        expected.append(np.linspace(start, stop, numsteps)[1:])
+    np.testing.assert_array_equal(fill_out_numbers(peaks, rate), np.vstack(expected))
+
+
+def test_fill_out_numbers_row_vector():
+    generated = fill_out_numbers([[0, 1, -1]], rate=0.25)
+    expected = fill_out_numbers([0, 1, -1], rate=0.25)
+    np.testing.assert_array_equal(generated, expected)
+
+
+def test_fill_out_numbers_single_peak():
+    np.testing.assert_array_equal(fill_out_numbers([3.0], rate=0.5), [3.0])
+
+
+def test_imposed_displacement_no_interpolation():
+    generated = UniaxialMaterialAnalysis._generate_imposed_displacement([0, 1, -2, 3])
+    expected = np.array([0.0, 0.0, 1.0, -2.0, 3.0, 3.0])
+    np.testing.assert_array_equal(generated, expected)
+
+
+def test_material_definition():
+    steel = material.Steel01(1, 50.0, 29000.0, 0.01)
+    for definition in [steel, str(steel), [steel], [material.Elastic(2, 1.0), steel]]:
+        analysis = UniaxialMaterialAnalysis(definition)
+        assert analysis._process_material_definition()[-1] == str(steel)
+
+
+def test_material_definition_custom_object():
+    class CustomMaterial:
+        def __str__(self):
+            return "uniaxialMaterial Elastic 1 29000"
+
+    analysis = UniaxialMaterialAnalysis(CustomMaterial())
+    assert analysis._process_material_definition() == [
+        "uniaxialMaterial Elastic 1 29000"
+    ]
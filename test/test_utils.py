@@ -1,3 +1,8 @@
+import pathlib
+
+import numpy as np
+from pytest import raises
+
 from opswrapper import utils
 
 
@@ -6,3 +11,38 @@ def test_tcllist():
         utils.tcllist([1.0, 2, "sam's the best!", "[this_wont_run]", "$no_substitutes"])
         == '[list "1.0" "2" "sam\'s the best!" "\\[this_wont_run]" "\\$no_substitutes"]'
     )
+
+
+def test_tclescape():
+    assert utils.tclescape(R'C:\path [$x] "y"') == R'"C:\\path \[\$x] \"y\""'
+    assert utils.tclescape("") == '""'
+    assert utils.tclescape("no specials {here}") == '"no specials {here}"'
+    assert utils.tclescape(R'\[$"') == R'"\\\[\$\""'
+
+
+def test_coerce_numeric():
+    assert type(utils.coerce_numeric(1, float)) is float
+    assert type(utils.coerce_numeric(1.0, int)) is int
+    assert type(utils.coerce_numeric(True, int)) is int
+    assert utils.coerce_numeric("$x", float) == "$x"
+    assert utils.coerce_numeric(1.5, str) == 1.5
+    assert utils.coerce_numeric(1.5, list[float]) == 1.5
+    assert utils.coerce_numeric(1j, float) == 1j
+    assert utils.coerce_numeric(float("inf"), int) == float("inf")
+    assert type(utils.coerce_numeric(np.float64(1.5), float)) is float
+    assert type(utils.coerce_numeric(np.int32(2), int)) is int
+
+
+def test_path_for_tcl():
+    assert utils.path_for_tcl("dir/file.dat") == "dir/file.dat"
+    assert utils.path_for_tcl(pathlib.Path("dir", "file.dat")) == "dir/file.dat"
+
+
+def test_value_type_dispatch():
+    dispatch = utils.ValueTypeDispatch(
+        "tangent", {"current": None, "initial": "-initial"}
+    )
+    assert dispatch["current"] is None
+    assert dispatch["initial"] == "-initial"
+    with raises(TypeError, match="Invalid tangent 'secant'"):
+        dispatch["secant"]